@@ -5,9 +5,27 @@ This module provides functionality to generate markdown reports
 from git commit analysis results.
 """
 
+import heapq
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, Any, List, Optional
+
+
+# Buffer size used when writing report files
+REPORT_WRITE_BUFFER_SIZE = 1 << 16
+
+# Per-commit header used in the "Detailed Commits" section
+_COMMIT_TMPL = "### Commit: `{short_hash}`\n\n**Date**: {date}  \n**Message**: {message}  \n\n"
+
+# Commit statistics listed under each commit, in display order
+_COMMIT_STAT_LABELS = (
+    ('files_changed', 'Files Changed'),
+    ('insertions', 'Insertions'),
+    ('deletions', 'Deletions'),
+)
 
 
 class ReportGenerator:
@@ -23,16 +41,24 @@ class ReportGenerator:
         self.reports_dir = reports_dir
         os.makedirs(self.reports_dir, exist_ok=True)
 
-    def generate_user_report(self, analysis_result: Dict[str, Any]) -> str:
+    def generate_user_report(self, analysis_result: Dict[str, Any],
+                             generated_at: Optional[str] = None,
+                             max_date_rows: Optional[int] = None) -> str:
         """
         Generate markdown report for a single user.
 
         Args:
             analysis_result: Analysis result from GitCommitAnalyzer
+            generated_at: Pre-formatted "Generated" timestamp (defaults to now)
+            max_date_rows: Only list the most recent N dates in the
+                commits-by-date table (defaults to all dates)
 
         Returns:
             Markdown report content
         """
+        if generated_at is None:
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
         username = analysis_result['username']
         period = analysis_result['period']
         total_commits = analysis_result['total_commits']
@@ -44,7 +70,7 @@ class ReportGenerator:
 
 **Analysis Period**: {period}
 **Total Commits**: {total_commits}
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {generated_at}
 
 ---
 
@@ -71,7 +97,11 @@ class ReportGenerator:
         if commits_by_date:
             report += "| Date | Commits |\n"
             report += "|------|---------|\n"
-            for date, count in sorted(commits_by_date.items(), reverse=True):
+            if max_date_rows is not None:
+                date_rows = heapq.nlargest(max_date_rows, commits_by_date.items(), key=itemgetter(0))
+            else:
+                date_rows = sorted(commits_by_date.items(), key=itemgetter(0), reverse=True)
+            for date, count in date_rows:
                 report += f"| {date} | {count} |\n"
         else:
             report += "*No commits in this period*\n"
@@ -80,43 +110,55 @@ class ReportGenerator:
 
         # Add detailed commit information
         if commits:
+            parts = []
             for commit in commits:
-                report += f"### Commit: `{commit['hash'][:8]}`\n\n"
-                report += f"**Date**: {commit['date']}  \n"
-                report += f"**Message**: {commit['message']}  \n\n"
+                parts.append(_COMMIT_TMPL.format(
+                    short_hash=commit['hash'][:8],
+                    date=commit['date'],
+                    message=commit['message']
+                ))
 
                 if commit.get('changed_files'):
-                    report += "**Changed Files**:\n\n"
-                    for file in commit['changed_files']:
-                        report += f"- `{file}`\n"
-
-                if commit.get('stats'):
-                    stat_info = commit['stats']
-                    if stat_info:
-                        report += "\n**Statistics**:\n"
-                        if 'files_changed' in stat_info:
-                            report += f"- Files Changed: {stat_info['files_changed']}\n"
-                        if 'insertions' in stat_info:
-                            report += f"- Insertions: {stat_info['insertions']}\n"
-                        if 'deletions' in stat_info:
-                            report += f"- Deletions: {stat_info['deletions']}\n"
-
-                report += "\n---\n\n"
+                    parts.append("**Changed Files**:\n\n")
+                    parts.extend(f"- `{file}`\n" for file in commit['changed_files'])
+
+                stat_info = commit.get('stats')
+                if stat_info:
+                    parts.append("\n**Statistics**:\n")
+                    parts.extend(
+                        f"- {label}: {stat_info[key]}\n"
+                        for key, label in _COMMIT_STAT_LABELS
+                        if key in stat_info
+                    )
+
+                parts.append("\n---\n\n")
+            report += "".join(parts)
         else:
             report += "*No commits found*\n"
 
         return report
 
-    def generate_multi_user_report(self, analysis_result: Dict[str, Any]) -> str:
+    def generate_multi_user_report(self, analysis_result: Dict[str, Any],
+                                   generated_at: Optional[str] = None,
+                                   date_str: Optional[str] = None) -> str:
         """
         Generate summary report for multiple users.
 
         Args:
             analysis_result: Multi-user analysis result from GitCommitAnalyzer
+            generated_at: Pre-formatted "Generated" timestamp (defaults to now)
+            date_str: YYYYMMDD date used in per-user report links (defaults to today)
 
         Returns:
             Markdown report content
         """
+        if generated_at is None or date_str is None:
+            now = datetime.now()
+            if generated_at is None:
+                generated_at = now.strftime('%Y-%m-%d %H:%M:%S')
+            if date_str is None:
+                date_str = now.strftime('%Y%m%d')
+
         period = analysis_result['period']
         overall = analysis_result['overall']
         users = analysis_result['users']
@@ -129,7 +171,7 @@ class ReportGenerator:
 **Active Users**: {overall['active_users']}
 **Total Commits**: {overall['total_commits']}
 **Total Files Changed**: {overall['total_files_changed']}
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {generated_at}
 
 ---
 
@@ -150,7 +192,7 @@ class ReportGenerator:
 
         # Add links to individual user reports
         for username in users.keys():
-            report += f"- [{username}]({username}-{datetime.now().strftime('%Y%m%d')}.md)\n"
+            report += f"- [{username}]({username}-{date_str}.md)\n"
 
         return report
 
@@ -167,15 +209,35 @@ class ReportGenerator:
         """
         filepath = os.path.join(self.reports_dir, filename)
 
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        # reports_dir is created in __init__; only nested filenames need
+        # their own directory created here
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-        # Write report
-        with open(filepath, 'w', encoding='utf-8') as f:
+        # Write report through a 64 KiB buffer to keep large reports to a
+        # handful of write() calls
+        with open(filepath, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as f:
             f.write(content)
 
         return filepath
 
+    def _build_and_save_one(self, username: str, user_data: Dict[str, Any],
+                            generated_at: str, filename_suffix: str) -> str:
+        """
+        Generate and save the report for a single user.
+
+        Args:
+            username: Username the report belongs to
+            user_data: Single-user analysis result
+            generated_at: Shared "Generated" timestamp for the batch
+            filename_suffix: Date/period suffix appended to the username
+
+        Returns:
+            Path to saved report
+        """
+        report_content = self.generate_user_report(user_data, generated_at)
+        return self.save_report(report_content, f"{username}{filename_suffix}")
+
     def generate_and_save_user_reports(self, analysis_results: Dict[str, Any]) -> Dict[str, str]:
         """
         Generate and save reports for all users.
@@ -190,33 +252,40 @@ class ReportGenerator:
         users = analysis_results['users']
         period = analysis_results['period']
 
-        for username, user_data in users.items():
-            # Generate report content
-            report_content = self.generate_user_report(user_data)
-
-            # Generate filename
-            days = None
-            if "days" in period.lower():
-                try:
-                    days = int(period.split()[1])  # Extract number from "Last X days"
-                except (IndexError, ValueError):
-                    pass
-
-            # Create filename
-            date_str = datetime.now().strftime("%Y%m%d")
-            if days:
-                filename = f"{username}-{date_str}-{days}days.md"
-            else:
-                filename = f"{username}-{date_str}.md"
-
-            # Save report
-            filepath = self.save_report(report_content, filename)
-            saved_reports[username] = filepath
+        # Share one timestamp across every report in this batch
+        now = datetime.now()
+        date_str = now.strftime("%Y%m%d")
+        generated_at = now.strftime('%Y-%m-%d %H:%M:%S')
+
+        # Parse the period once; it is the same for every user
+        days = None
+        if "days" in period.lower():
+            try:
+                days = int(period.split()[1])  # Extract number from "Last X days"
+            except (IndexError, ValueError):
+                pass
+
+        if days:
+            filename_suffix = f"-{date_str}-{days}days.md"
+        else:
+            filename_suffix = f"-{date_str}.md"
+
+        # Write per-user reports concurrently; map() keeps the user order
+        if users:
+            with ThreadPoolExecutor(max_workers=min(32, len(users))) as executor:
+                filepaths = executor.map(
+                    self._build_and_save_one,
+                    users.keys(),
+                    users.values(),
+                    repeat(generated_at),
+                    repeat(filename_suffix)
+                )
+                saved_reports.update(zip(users.keys(), filepaths))
 
         # Generate and save multi-user summary report
         if len(users) > 1:
-            summary_content = self.generate_multi_user_report(analysis_results)
-            summary_filename = f"summary-{datetime.now().strftime('%Y%m%d')}.md"
+            summary_content = self.generate_multi_user_report(analysis_results, generated_at, date_str)
+            summary_filename = f"summary-{date_str}.md"
             summary_path = self.save_report(summary_content, summary_filename)
             saved_reports['summary'] = summary_path
 
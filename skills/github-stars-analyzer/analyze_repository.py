@@ -3,9 +3,83 @@ Repository analysis module.
 Core engine for analyzing GitHub repository metrics and trends.
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import statistics
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import repeat
+import copy
+import math
+import sys
+import threading
+import time
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Analysis results are cached per analyzer so repeated lookups of the same
+# repository (e.g. compare_repositories followed by calculate_growth_metrics)
+# do not hit the GitHub API again while the data is still fresh.
+ANALYSIS_CACHE_SIZE = 256
+ANALYSIS_CACHE_TTL = 300  # seconds
+
+# Repositories analyzed at once by compare_repositories. Each analysis makes
+# its API calls sequentially, so this is also the number of requests in
+# flight on the shared GitHubAPIHandler session; it stays well below the
+# handler's low-quota threshold and the session's connection pool size.
+MAX_CONCURRENT_ANALYSES = 4
+
+# Popularity score weights
+_POP_W_STARS = 0.4
+_POP_W_FORKS = 0.3
+_POP_W_CONTRIB = 0.2
+_POP_W_ACT = 0.1
+
+# Health score weights
+_HEALTH_W_ACT = 0.4
+_HEALTH_W_ISSUES = 0.3
+_HEALTH_W_FORKS = 0.3
+
+# Growth categories: bisect_right over the lower bound of each category.
+# The smallest positive float separates "Stagnant" (exactly 0) from "Minimal".
+_GROWTH_THRESHOLDS = (0.0, math.nextafter(0.0, 1.0), 0.05, 0.2, 0.5, 1.0)
+_GROWTH_LABELS = ("Declining", "Stagnant", "Minimal", "Slow", "Steady", "Rapid", "Explosive")
+
+# Python 3.11+ parses the trailing "Z" of GitHub timestamps natively
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=256)
+def _parse_github_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp into a timezone-aware datetime."""
+    return _fromisoformat(value)
+
+
+# Minimum number of repositories before scores and comparison aggregates
+# are computed with numpy (imported lazily so small runs never load it)
+BATCH_SCORE_THRESHOLD = 32
+
+
+@lru_cache(maxsize=1)
+def _numpy_available() -> bool:
+    """Return True if numpy can be imported; it is optional for this module."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _use_numpy(count: int) -> bool:
+    """Return True if a batch of count repositories should use the numpy paths."""
+    return count >= BATCH_SCORE_THRESHOLD and _numpy_available()
 
 
 class RepositoryAnalyzer:
@@ -20,6 +94,13 @@ class RepositoryAnalyzer:
         """
         self.github_api = github_api_handler
         self.metrics = {}
+        self._analysis_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Drop cached analyses, e.g. after changing GitHub credentials."""
+        with self._analysis_cache_lock:
+            self._analysis_cache.clear()
 
     def safe_divide(self, numerator: float, denominator: float, default: float = 0.0) -> float:
         """Safely divide two numbers, returning default if denominator is zero."""
@@ -39,10 +120,100 @@ class RepositoryAnalyzer:
         Returns:
             Dictionary with comprehensive analysis
         """
+        return self._with_scores(self._get_raw_analysis(owner, repo, days))
+
+    def _with_scores(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of an unscored analysis with popularity and health scores."""
+        metrics = analysis["metrics"]
+        commits_per_day = analysis["activity"].get("commits_per_day", 0)
+
+        return {
+            **analysis,
+            "popularity_score": self.calculate_popularity_score(
+                metrics["stars"], metrics["forks"], metrics["contributors"], commits_per_day
+            ),
+            "health_score": self.calculate_health_score(
+                metrics["stars"], metrics["forks"], metrics["open_issues"], commits_per_day
+            )
+        }
+
+    def _get_cached_analysis(self, key: Tuple[str, str, int]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached analysis for key, or None."""
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ANALYSIS_CACHE_TTL:
+                self._analysis_cache.move_to_end(key)
+                # Callers get their own copy so mutating a result
+                # (including nested metrics) cannot alter the cache
+                return copy.deepcopy(cached[1])
+        return None
+
+    def _get_raw_analysis(self, owner: str, repo: str, days: int) -> Dict[str, Any]:
+        """Return the unscored analysis for a repository, using the cache when fresh."""
+        key = (owner, repo, days)
+        cached = self._get_cached_analysis(key)
+        if cached is not None:
+            return cached
+
+        now = time.monotonic()
+        analysis = self._fetch_analysis(owner, repo, days)
+
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = (now, copy.deepcopy(analysis))
+            self._analysis_cache.move_to_end(key)
+            while len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+        return analysis
+
+    def _repository_age(self, created_at: str, stars: int) -> Tuple[int, float]:
+        """Return (age in days, stars per day) from a GitHub created_at timestamp."""
+        if not created_at:
+            return 0, 0
+
+        created_date = _parse_github_timestamp(created_at)
+        age_days = (datetime.now(timezone.utc) - created_date).days
+        return age_days, self.safe_divide(stars, age_days)
+
+    def _fetch_basic(self, owner: str, repo: str) -> Dict[str, Any]:
+        """
+        Fetch only the metrics needed for growth calculations.
+
+        Unlike _fetch_analysis this makes a single API call and skips
+        contributors, languages and activity.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            Dictionary with stars, age_days and stars_per_day
+        """
+        try:
+            repo_info = self.github_api.get_repository_info(owner, repo)
+            stars = repo_info.get("stargazers_count", 0)
+            age_days, stars_per_day = self._repository_age(repo_info.get("created_at", ""), stars)
+
+            return {
+                "stars": stars,
+                "age_days": age_days,
+                "stars_per_day": stars_per_day
+            }
+
+        except Exception as e:
+            raise Exception(f"Failed to analyze repository {owner}/{repo}: {e}")
+
+    def _fetch_analysis(self, owner: str, repo: str, days: int) -> Dict[str, Any]:
+        """Fetch a repository analysis (without scores), bypassing the cache."""
         try:
             # Fetch basic repository info
             repo_info = self.github_api.get_repository_info(owner, repo)
 
+            # Get additional metrics
+            contributors = self.github_api.get_contributors_count(owner, repo)
+            languages = self.github_api.get_repository_languages(owner, repo)
+            activity = self.github_api.get_repository_activity(owner, repo, days)
+
             # Calculate metrics
             stars = repo_info.get("stargazers_count", 0)
             forks = repo_info.get("forks_count", 0)
@@ -57,19 +228,8 @@ class RepositoryAnalyzer:
             stars_per_watcher = self.safe_divide(stars, watchers)
             issues_per_star = self.safe_divide(open_issues, stars)
 
-            # Get additional metrics
-            contributors = self.github_api.get_contributors_count(owner, repo)
-            languages = self.github_api.get_repository_languages(owner, repo)
-            activity = self.github_api.get_repository_activity(owner, repo, days)
-
             # Calculate repository age
-            if created_at:
-                created_date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                age_days = (datetime.now() - created_date).days
-                stars_per_day = self.safe_divide(stars, age_days)
-            else:
-                age_days = 0
-                stars_per_day = 0
+            age_days, stars_per_day = self._repository_age(created_at, stars)
 
             # Build comprehensive analysis
             analysis = {
@@ -96,13 +256,7 @@ class RepositoryAnalyzer:
                     "issues_per_star": issues_per_star
                 },
                 "activity": activity,
-                "languages": languages,
-                "popularity_score": self.calculate_popularity_score(
-                    stars, forks, contributors, activity.get("commits_per_day", 0)
-                ),
-                "health_score": self.calculate_health_score(
-                    stars, forks, open_issues, activity.get("commits_per_day", 0)
-                )
+                "languages": languages
             }
 
             return analysis
@@ -123,25 +277,18 @@ class RepositoryAnalyzer:
         Returns:
             Popularity score (0-100)
         """
-        # Normalize metrics (log scale for stars and forks)
-        star_score = min(100, (stars ** 0.5) * 2) if stars > 0 else 0
-        fork_score = min(100, (forks ** 0.5) * 5) if forks > 0 else 0
+        # Normalize metrics (square-root scale for stars and forks)
+        star_score = min(100, math.sqrt(stars) * 2) if stars > 0 else 0
+        fork_score = min(100, math.sqrt(forks) * 5) if forks > 0 else 0
         contributor_score = min(100, contributors * 10) if contributors > 0 else 0
         activity_score = min(100, commits_per_day * 100) if commits_per_day > 0 else 0
 
         # Weighted average
-        weights = {
-            "stars": 0.4,
-            "forks": 0.3,
-            "contributors": 0.2,
-            "activity": 0.1
-        }
-
         score = (
-            star_score * weights["stars"] +
-            fork_score * weights["forks"] +
-            contributor_score * weights["contributors"] +
-            activity_score * weights["activity"]
+            star_score * _POP_W_STARS +
+            fork_score * _POP_W_FORKS +
+            contributor_score * _POP_W_CONTRIB +
+            activity_score * _POP_W_ACT
         )
 
         return round(score, 2)
@@ -171,20 +318,175 @@ class RepositoryAnalyzer:
         fork_score = min(100, forks_per_star * 500)
 
         # Weighted average
-        weights = {
-            "activity": 0.4,
-            "issues": 0.3,
-            "forks": 0.3
-        }
-
         score = (
-            activity_score * weights["activity"] +
-            issue_score * weights["issues"] +
-            fork_score * weights["forks"]
+            activity_score * _HEALTH_W_ACT +
+            issue_score * _HEALTH_W_ISSUES +
+            fork_score * _HEALTH_W_FORKS
         )
 
         return round(score, 2)
 
+    def _batch_scores(self, stars: "np.ndarray", forks: "np.ndarray", contributors: "np.ndarray",
+                      open_issues: "np.ndarray", commits_per_day: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Vectorized equivalent of calculate_popularity_score and calculate_health_score.
+
+        Args:
+            stars: Star counts
+            forks: Fork counts
+            contributors: Contributor counts
+            open_issues: Open issue counts
+            commits_per_day: Average commits per day
+
+        Returns:
+            Tuple of unrounded (popularity scores, health scores)
+        """
+        import numpy as np
+
+        star_score = np.minimum(100, np.sqrt(np.maximum(stars, 0)) * 2)
+        fork_score = np.minimum(100, np.sqrt(np.maximum(forks, 0)) * 5)
+        contributor_score = np.clip(contributors * 10, 0, 100)
+        activity_score = np.clip(commits_per_day * 100, 0, 100)
+
+        popularity = (
+            star_score * _POP_W_STARS +
+            fork_score * _POP_W_FORKS +
+            contributor_score * _POP_W_CONTRIB +
+            activity_score * _POP_W_ACT
+        )
+
+        has_stars = stars != 0
+        issues_per_star = np.divide(open_issues, stars, out=np.zeros(len(stars)), where=has_stars)
+        forks_per_star = np.divide(forks, stars, out=np.zeros(len(stars)), where=has_stars)
+
+        health = (
+            np.clip(commits_per_day * 200, 0, 100) * _HEALTH_W_ACT +
+            np.maximum(0, 100 - issues_per_star * 1000) * _HEALTH_W_ISSUES +
+            np.minimum(100, forks_per_star * 500) * _HEALTH_W_FORKS
+        )
+
+        # Rounding is left to the caller: np.round does not always agree
+        # with the built-in round() used by the scalar scoring methods
+        return popularity, health
+
+    def _score_analyses(self, analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach popularity and health scores to unscored analyses."""
+        if not _use_numpy(len(analyses)):
+            return [self._with_scores(a) for a in analyses]
+
+        import numpy as np
+
+        metrics = [a["metrics"] for a in analyses]
+        popularity, health = self._batch_scores(
+            np.array([m["stars"] for m in metrics], dtype=float),
+            np.array([m["forks"] for m in metrics], dtype=float),
+            np.array([m["contributors"] for m in metrics], dtype=float),
+            np.array([m["open_issues"] for m in metrics], dtype=float),
+            np.array([a["activity"].get("commits_per_day", 0) for a in analyses], dtype=float)
+        )
+
+        return [
+            {**a, "popularity_score": round(float(p), 2), "health_score": round(float(h), 2)}
+            for a, p, h in zip(analyses, popularity, health)
+        ]
+
+    def _safe_analyze(self, owner: str, repo: str, days: int) -> Optional[Dict[str, Any]]:
+        """Fetch an unscored analysis, returning None (with a warning) on failure."""
+        try:
+            return self._get_raw_analysis(owner, repo, days)
+        except Exception as e:
+            print(f"Warning: Failed to analyze {owner}/{repo}: {e}")
+            return None
+
+    def _aggregate(self, analyses: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, List[int]]]:
+        """
+        Compute comparison summary values and ranking orders in plain Python.
+
+        Args:
+            analyses: Scored repository analyses
+
+        Returns:
+            Tuple of (summary fields, ranking name -> descending index order)
+        """
+        count = len(analyses)
+        star_counts = [a["metrics"]["stars"] for a in analyses]
+        fork_counts = [a["metrics"]["forks"] for a in analyses]
+        popularity_scores = [a["popularity_score"] for a in analyses]
+        health_scores = [a["health_score"] for a in analyses]
+
+        def ranked(values: List[float]) -> List[int]:
+            return sorted(range(count), key=values.__getitem__, reverse=True)
+
+        summary = {
+            "total_stars": sum(star_counts),
+            "total_forks": sum(fork_counts),
+            "average_stars": sum(star_counts) / count,
+            "average_forks": sum(fork_counts) / count,
+            "average_popularity": sum(popularity_scores) / count,
+            "average_health": sum(health_scores) / count,
+            "max_stars": max(star_counts),
+            "min_stars": min(star_counts),
+            "max_popularity": max(popularity_scores),
+            "min_popularity": min(popularity_scores)
+        }
+        orders = {
+            "by_stars": ranked(star_counts),
+            "by_popularity": ranked(popularity_scores),
+            "by_health": ranked(health_scores)
+        }
+
+        return summary, orders
+
+    def _aggregate_with_numpy(self, analyses: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, List[int]]]:
+        """
+        Compute comparison summary values and ranking orders with numpy.
+
+        Args:
+            analyses: Scored repository analyses
+
+        Returns:
+            Tuple of (summary fields, ranking name -> descending index order)
+        """
+        import numpy as np
+
+        # One structured array holds every column
+        columns = np.fromiter(
+            (
+                (a["metrics"]["stars"], a["metrics"]["forks"], a["popularity_score"], a["health_score"])
+                for a in analyses
+            ),
+            dtype=[("stars", "i8"), ("forks", "i8"), ("popularity", "f8"), ("health", "f8")],
+            count=len(analyses)
+        )
+        star_counts = columns["stars"]
+        fork_counts = columns["forks"]
+        popularity_scores = columns["popularity"]
+        health_scores = columns["health"]
+
+        def ranked(values) -> List[int]:
+            # Stable descending order, matching sorted(..., reverse=True)
+            return np.argsort(-values, kind="stable").tolist()
+
+        summary = {
+            "total_stars": int(star_counts.sum()),
+            "total_forks": int(fork_counts.sum()),
+            "average_stars": float(star_counts.mean()),
+            "average_forks": float(fork_counts.mean()),
+            "average_popularity": float(popularity_scores.mean()),
+            "average_health": float(health_scores.mean()),
+            "max_stars": int(star_counts.max()),
+            "min_stars": int(star_counts.min()),
+            "max_popularity": float(popularity_scores.max()),
+            "min_popularity": float(popularity_scores.min())
+        }
+        orders = {
+            "by_stars": ranked(star_counts),
+            "by_popularity": ranked(popularity_scores),
+            "by_health": ranked(health_scores)
+        }
+
+        return summary, orders
+
     def compare_repositories(self, repositories: List[Dict[str, str]], days: int = 30) -> Dict[str, Any]:
         """
         Compare multiple repositories.
@@ -196,57 +498,40 @@ class RepositoryAnalyzer:
         Returns:
             Dictionary with comparative analysis
         """
+        targets = [
+            (repo_info.get("owner"), repo_info.get("repo"))
+            for repo_info in repositories
+            if repo_info.get("owner") and repo_info.get("repo")
+        ]
+
+        # Repositories are analyzed concurrently; results keep input order
         analyses = []
-        for repo_info in repositories:
-            owner = repo_info.get("owner")
-            repo = repo_info.get("repo")
-            if owner and repo:
-                try:
-                    analysis = self.analyze_single_repository(owner, repo, days)
-                    analyses.append(analysis)
-                except Exception as e:
-                    print(f"Warning: Failed to analyze {owner}/{repo}: {e}")
+        if targets:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_ANALYSES, len(targets))) as executor:
+                owners, repos = zip(*targets)
+                results = executor.map(self._safe_analyze, owners, repos, repeat(days))
+                analyses = [analysis for analysis in results if analysis is not None]
 
         if not analyses:
             raise ValueError("No repositories could be analyzed")
 
+        analyses = self._score_analyses(analyses)
+
         # Calculate comparative metrics
-        star_counts = [a["metrics"]["stars"] for a in analyses]
-        fork_counts = [a["metrics"]["forks"] for a in analyses]
-        popularity_scores = [a["popularity_score"] for a in analyses]
-        health_scores = [a["health_score"] for a in analyses]
+        if _use_numpy(len(analyses)):
+            summary, orders = self._aggregate_with_numpy(analyses)
+        else:
+            summary, orders = self._aggregate(analyses)
 
         comparison = {
             "repositories": analyses,
             "summary": {
                 "total_repositories": len(analyses),
-                "total_stars": sum(star_counts),
-                "total_forks": sum(fork_counts),
-                "average_stars": statistics.mean(star_counts) if star_counts else 0,
-                "average_forks": statistics.mean(fork_counts) if fork_counts else 0,
-                "average_popularity": statistics.mean(popularity_scores) if popularity_scores else 0,
-                "average_health": statistics.mean(health_scores) if health_scores else 0,
-                "max_stars": max(star_counts) if star_counts else 0,
-                "min_stars": min(star_counts) if star_counts else 0,
-                "max_popularity": max(popularity_scores) if popularity_scores else 0,
-                "min_popularity": min(popularity_scores) if popularity_scores else 0
+                **summary
             },
             "rankings": {
-                "by_stars": sorted(
-                    analyses,
-                    key=lambda x: x["metrics"]["stars"],
-                    reverse=True
-                ),
-                "by_popularity": sorted(
-                    analyses,
-                    key=lambda x: x["popularity_score"],
-                    reverse=True
-                ),
-                "by_health": sorted(
-                    analyses,
-                    key=lambda x: x["health_score"],
-                    reverse=True
-                )
+                name: [analyses[i] for i in order]
+                for name, order in orders.items()
             }
         }
 
@@ -264,11 +549,18 @@ class RepositoryAnalyzer:
         Returns:
             Dictionary with growth metrics
         """
-        analysis = self.analyze_single_repository(owner, repo, days)
-
-        stars = analysis["metrics"]["stars"]
-        stars_per_day = analysis["metrics"]["stars_per_day"]
-        age_days = analysis["basic_info"]["age_days"]
+        # Reuse a cached full analysis if there is one; otherwise only the
+        # repository info is needed, not contributors/languages/activity
+        analysis = self._get_cached_analysis((owner, repo, days))
+        if analysis is not None:
+            stars = analysis["metrics"]["stars"]
+            stars_per_day = analysis["metrics"]["stars_per_day"]
+            age_days = analysis["basic_info"]["age_days"]
+        else:
+            basic = self._fetch_basic(owner, repo)
+            stars = basic["stars"]
+            stars_per_day = basic["stars_per_day"]
+            age_days = basic["age_days"]
 
         # Calculate growth rates
         if age_days > 0:
@@ -280,9 +572,12 @@ class RepositoryAnalyzer:
 
         # Project future growth
         if daily_growth_rate > 0:
-            projected_30_days = stars * (1 + daily_growth_rate/100) ** 30
-            projected_90_days = stars * (1 + daily_growth_rate/100) ** 90
-            projected_180_days = stars * (1 + daily_growth_rate/100) ** 180
+            # Compound the 30-day factor instead of three separate powers
+            growth_30 = (1 + daily_growth_rate/100) ** 30
+            growth_90 = growth_30 * growth_30 * growth_30
+            projected_30_days = stars * growth_30
+            projected_90_days = stars * growth_90
+            projected_180_days = stars * growth_90 * growth_90
         else:
             projected_30_days = projected_90_days = projected_180_days = stars
 
@@ -312,17 +607,4 @@ class RepositoryAnalyzer:
         Returns:
             Growth category string
         """
-        if daily_growth_rate >= 1.0:
-            return "Explosive"
-        elif daily_growth_rate >= 0.5:
-            return "Rapid"
-        elif daily_growth_rate >= 0.2:
-            return "Steady"
-        elif daily_growth_rate >= 0.05:
-            return "Slow"
-        elif daily_growth_rate > 0:
-            return "Minimal"
-        elif daily_growth_rate == 0:
-            return "Stagnant"
-        else:
-            return "Declining"
\ No newline at end of file
+        return _GROWTH_LABELS[bisect_right(_GROWTH_THRESHOLDS, daily_growth_rate)]
@@ -4,6 +4,7 @@ Handles data fetching from GitHub API with rate limit management.
 """
 
 import requests
+import threading
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
@@ -24,6 +25,7 @@ class GitHubAPIHandler:
         self.session = requests.Session()
         self.rate_limit_remaining = 60  # Default for unauthenticated
         self.rate_limit_reset = 0
+        self._rate_limit_lock = threading.Lock()
 
         if github_token:
             self.session.headers.update({
@@ -33,13 +35,20 @@ class GitHubAPIHandler:
             self.rate_limit_remaining = 5000  # Higher limit for authenticated
 
     def check_rate_limit(self) -> None:
-        """Check and respect GitHub API rate limits."""
-        if self.rate_limit_remaining <= 5:
-            wait_time = max(self.rate_limit_reset - time.time(), 0)
-            if wait_time > 0:
-                print(f"Rate limit low. Waiting {wait_time:.0f} seconds...")
-                time.sleep(wait_time + 1)
-            self.update_rate_limit()
+        """
+        Check and respect GitHub API rate limits, reserving one request.
+
+        The check and the reservation happen under a lock so concurrent
+        callers cannot all pass the threshold before any of them is counted.
+        """
+        with self._rate_limit_lock:
+            if self.rate_limit_remaining <= 5:
+                wait_time = max(self.rate_limit_reset - time.time(), 0)
+                if wait_time > 0:
+                    print(f"Rate limit low. Waiting {wait_time:.0f} seconds...")
+                    time.sleep(wait_time + 1)
+                self.update_rate_limit()
+            self.rate_limit_remaining -= 1
 
     def update_rate_limit(self) -> None:
         """Update rate limit information from GitHub API."""
@@ -70,7 +79,6 @@ class GitHubAPIHandler:
 
         try:
             response = self.session.get(url)
-            self.rate_limit_remaining -= 1
 
             if response.status_code == 200:
                 return response.json()
@@ -100,7 +108,6 @@ class GitHubAPIHandler:
 
         try:
             response = self.session.get(url, params=params)
-            self.rate_limit_remaining -= 1
 
             if response.status_code == 200:
                 return response.json()
@@ -156,7 +163,6 @@ class GitHubAPIHandler:
 
         try:
             response = self.session.get(url, params=params)
-            self.rate_limit_remaining -= 1
 
             if response.status_code == 200:
                 # GitHub returns pagination info in headers
@@ -192,7 +198,6 @@ class GitHubAPIHandler:
 
         try:
             response = self.session.get(url, params=params)
-            self.rate_limit_remaining -= 1
 
             if response.status_code == 200:
                 link_header = response.headers.get("Link", "")
@@ -224,7 +229,6 @@ class GitHubAPIHandler:
 
         try:
             response = self.session.get(url)
-            self.rate_limit_remaining -= 1
 
             if response.status_code == 200:
                 return response.json()
@@ -257,7 +261,6 @@ class GitHubAPIHandler:
 
         try:
             response = self.session.get(url, params=params)
-            self.rate_limit_remaining -= 1
 
             if response.status_code == 200:
                 commits = response.json()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the repository analysis module.
+
+Uses an in-memory stand-in for GitHubAPIHandler, so no network access
+is needed. Runs under pytest or directly as a script.
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analyze_repository import BATCH_SCORE_THRESHOLD, RepositoryAnalyzer
+
+
+class FakeGitHubAPI:
+    """Minimal GitHubAPIHandler replacement that counts API calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_repository_info(self, owner, repo):
+        self.calls += 1
+        return {
+            "stargazers_count": 1200,
+            "forks_count": 150,
+            "watchers_count": 80,
+            "open_issues_count": 12,
+            "size": 512,
+            "created_at": "2020-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "full_name": f"{owner}/{repo}"
+        }
+
+    def get_contributors_count(self, owner, repo):
+        self.calls += 1
+        return 9
+
+    def get_repository_languages(self, owner, repo):
+        self.calls += 1
+        return {"Python": 1000}
+
+    def get_repository_activity(self, owner, repo, days=30):
+        self.calls += 1
+        return {"commit_count": 30, "days_active": days, "commits_per_day": 30 / days}
+
+
+def test_cached_analysis_is_not_mutated_by_callers():
+    """Mutating a returned analysis must not leak into later cached results."""
+    api = FakeGitHubAPI()
+    analyzer = RepositoryAnalyzer(api)
+
+    first = analyzer.analyze_single_repository("owner", "repo")
+    first["metrics"]["stars"] = 0
+    first["basic_info"]["age_days"] = -1
+    first["languages"]["Python"] = 0
+    first["activity"]["commits_per_day"] = 0
+
+    second = analyzer.analyze_single_repository("owner", "repo")
+    assert api.calls == 4, "second call should be served from the cache"
+    assert second["metrics"]["stars"] == 1200
+    assert second["basic_info"]["age_days"] > 0
+    assert second["languages"] == {"Python": 1000}
+    assert second["activity"]["commits_per_day"] == 1.0
+
+    comparison = analyzer.compare_repositories([{"owner": "owner", "repo": "repo"}])
+    comparison["repositories"][0]["metrics"]["stars"] = 0
+
+    growth = analyzer.calculate_growth_metrics("owner", "repo")
+    assert growth["current_stars"] == 1200
+    assert api.calls == 4
+
+
+class TableGitHubAPI(FakeGitHubAPI):
+    """Fake handler serving per-repository metrics from a lookup table."""
+
+    def __init__(self, table):
+        super().__init__()
+        self.table = table
+
+    def get_repository_info(self, owner, repo):
+        info = super().get_repository_info(owner, repo)
+        stars, forks, _, open_issues, _ = self.table[repo]
+        info.update(stargazers_count=stars, forks_count=forks, open_issues_count=open_issues)
+        return info
+
+    def get_contributors_count(self, owner, repo):
+        return self.table[repo][2]
+
+    def get_repository_activity(self, owner, repo, days=30):
+        return {"commit_count": 0, "days_active": days, "commits_per_day": self.table[repo][4]}
+
+
+def test_batch_scores_match_scalar_scores():
+    """Scores must not depend on whether the batch (numpy) path is taken."""
+    rng = random.Random(1234)
+    table = {
+        # Values where np.round(x, 2) and round(x, 2) disagree
+        "edge": (499556, 49010, 28, 12, 0.5965),
+        "zero": (0, 0, 0, 0, 0.0),
+    }
+    for i in range(BATCH_SCORE_THRESHOLD * 4):
+        table[f"repo{i}"] = (
+            rng.randint(0, 10 ** 6), rng.randint(0, 10 ** 5), rng.randint(0, 50),
+            rng.randint(0, 5000), rng.random() * 2
+        )
+
+    analyzer = RepositoryAnalyzer(TableGitHubAPI(table))
+    comparison = analyzer.compare_repositories([{"owner": "o", "repo": name} for name in table])
+
+    for analysis in comparison["repositories"]:
+        stars, forks, contributors, open_issues, commits_per_day = table[analysis["basic_info"]["repo"]]
+        assert analysis["popularity_score"] == analyzer.calculate_popularity_score(
+            stars, forks, contributors, commits_per_day
+        )
+        assert analysis["health_score"] == analyzer.calculate_health_score(
+            stars, forks, open_issues, commits_per_day
+        )
+
+    edge = next(a for a in comparison["repositories"] if a["basic_info"]["repo"] == "edge")
+    assert edge["popularity_score"] == 95.97
+
+
+if __name__ == "__main__":
+    test_cached_analysis_is_not_mutated_by_callers()
+    print("✓ Cached analyses are isolated from caller mutation")
+    test_batch_scores_match_scalar_scores()
+    print("✓ Batch scores match scalar scores")